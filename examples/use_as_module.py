@@ -3,6 +3,7 @@
 Example script demonstrating how to use pharma_papers as a module.
 """
 
+import logging
 import sys
 
 from pharma_papers.paper_processor import PaperProcessor
@@ -16,6 +17,9 @@ def main():
     """
     print("Using pharma_papers as a module to search for cancer immunotherapy papers")
 
+    # The library only creates loggers; configuring output is up to the application
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
     # Initialize client and processor
     pubmed_client = PubMedClient(email="your.email@example.com", debug=True)
     paper_processor = PaperProcessor(debug=True)
@@ -4,21 +4,14 @@ Command-line interface for the pharma_papers package.
 
 import logging
 import sys
-from typing import Optional
-
-import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from typing import TYPE_CHECKING, Any, Optional
 
 from pharma_papers.paper_processor import PaperProcessor
 from pharma_papers.pubmed_client import PubMedClient
 from pharma_papers.utils import export_to_csv
 
-# Set up typer app
-app = typer.Typer(help="Fetch research papers from PubMed with pharmaceutical company affiliations")
-
-# Set up rich console for pretty output
-console = Console()
+if TYPE_CHECKING:
+    import typer
 
 
 def setup_logging(debug: bool = False) -> None:
@@ -35,37 +28,13 @@ def setup_logging(debug: bool = False) -> None:
     )
 
 
-@app.command()
 def main(
-        query: str = typer.Argument(
-            ...,
-            help="PubMed query string (follows PubMed's query syntax)"
-        ),
-        file: Optional[str] = typer.Option(
-            None,
-            "-f", "--file",
-            help="Output filename for CSV results (if not provided, prints to console)"
-        ),
-        debug: bool = typer.Option(
-            False,
-            "-d", "--debug",
-            help="Enable debug mode with verbose logging"
-        ),
-        max_results: int = typer.Option(
-            100,
-            "-m", "--max",
-            help="Maximum number of results to fetch from PubMed"
-        ),
-        email: str = typer.Option(
-            "user@example.com",
-            "--email",
-            help="Email address for NCBI API (required by their terms of service)"
-        ),
-        api_key: Optional[str] = typer.Option(
-            None,
-            "--api-key",
-            help="NCBI API key for higher rate limits (optional)"
-        ),
+        query: str,
+        file: Optional[str] = None,
+        debug: bool = False,
+        max_results: int = 100,
+        email: str = "user@example.com",
+        api_key: Optional[str] = None,
 ) -> None:
     """
     Fetch research papers based on a PubMed query and identify those with authors
@@ -74,6 +43,13 @@ def main(
     Results are returned as a CSV file with details about the papers and their
     non-academic authors.
     """
+    # Rich is only needed once a command actually runs
+    from rich.console import Console
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    # Set up rich console for pretty output
+    console = Console()
+
     # Set up logging
     setup_logging(debug)
 
@@ -124,5 +100,64 @@ def main(
         sys.exit(1)
 
 
+def _create_app() -> "typer.Typer":
+    """
+    Create the typer app wrapping the main command.
+
+    Returns:
+        The typer app
+    """
+    import typer
+
+    app = typer.Typer(help="Fetch research papers from PubMed with pharmaceutical company affiliations")
+
+    @app.command(help=main.__doc__)
+    def command(
+            query: str = typer.Argument(
+                ...,
+                help="PubMed query string (follows PubMed's query syntax)"
+            ),
+            file: Optional[str] = typer.Option(
+                None,
+                "-f", "--file",
+                help="Output filename for CSV results (if not provided, prints to console)"
+            ),
+            debug: bool = typer.Option(
+                False,
+                "-d", "--debug",
+                help="Enable debug mode with verbose logging"
+            ),
+            max_results: int = typer.Option(
+                100,
+                "-m", "--max",
+                help="Maximum number of results to fetch from PubMed"
+            ),
+            email: str = typer.Option(
+                "user@example.com",
+                "--email",
+                help="Email address for NCBI API (required by their terms of service)"
+            ),
+            api_key: Optional[str] = typer.Option(
+                None,
+                "--api-key",
+                help="NCBI API key for higher rate limits (optional)"
+            ),
+    ) -> None:
+        main(query, file=file, debug=debug, max_results=max_results, email=email, api_key=api_key)
+
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create the typer app on first access, so importing this module does not import typer and rich.
+    """
+    if name == "app":
+        app = _create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
-    app()
+    _create_app()()
@@ -3,81 +3,380 @@ Module for processing paper data to identify and filter authors with pharmaceuti
 """
 
 import logging
-import re
-from typing import Dict, List, Set, Any, Optional, Tuple
+import os
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Set, Any, Optional, Tuple
+
+try:
+    # RE2 matches in linear time; fall back to the standard library engine when it is not installed
+    import re2 as _re  # type: ignore[import-untyped]
+except ImportError:
+    import re as _re
+
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+except ImportError:
+    ahocorasick = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Common pharmaceutical/biotech company identifiers in affiliations
+_PHARMA_INDICATORS = (
+    r'\b(?:pharma(?:ceutical)?s?|biotech|therapeutics|biosciences)\b',
+    r'\binc\.?\b|\bllc\.?\b|\bltd\.?\b|\bcorp\.?\b|\bcorporation\b',
+    r'\blaborator(?:y|ies)\b',
+    r'\bmedical\s+research\b',
+    r'\bbiopharm(?:a|aceutical)?\b',
+    r'\bbiolog(?:y|ical)s?\b',
+    r'\blife\s+sciences\b',
+    r'\bhealth(?:care)?\b',
+    r'\bmedicine[s]?\b',
+    r'\bgenetics\b',
+    r'\btherapeutics\b',
+    r'\btechnology\b'
+)
+
+# Common academic institution identifiers to exclude
+_ACADEMIC_INDICATORS = (
+    r'\buniversity\b|\bcollege\b|\bcampus\b',
+    r'\bschool\s+of\b',
+    r'\bacadem(?:y|ic)\b',
+    r'\binstitut(?:e|ion)\b',
+    r'\bdepartment\b|\bdept\.?\b',
+    r'\bhospital\b',
+    r'\bmedical\s+center\b|\bhealth\s+center\b',
+    r'\bclinic(?:al)?\b',
+    r'\bschool\b',
+    r'\bfaculty\b',
+    r'\bcampus\b',
+    r'\bprofessor\b',
+    r'\bedu\b'
+)
+
+# Known major pharmaceutical companies
+_PHARMA_COMPANIES = frozenset({
+    'pfizer', 'merck', 'novartis', 'roche', 'sanofi', 'johnson & johnson', 'j&j',
+    'glaxosmithkline', 'gsk', 'astrazeneca', 'abbvie', 'lilly', 'eli lilly',
+    'bristol-myers squibb', 'bms', 'amgen', 'gilead', 'biogen',
+    'bayer', 'boehringer', 'takeda', 'astellas', 'daiichi', 'eisai',
+    'genentech', 'regeneron', 'moderna', 'biontech', 'curevac',
+    'vertex', 'alexion', 'celgene', 'shire', 'incyte', 'seagen',
+    'novavax', 'biomarin', 'alkermes', 'viatris', 'teva',
+    'jazz', 'united therapeutics', 'ionis', 'allogene', 'bluebird bio'
+})
+
+# Company names normalized the way they appear in email domains (e.g. "eli lilly" -> "elililly")
+_NORM_COMPANY_MAP = {
+    company.replace(' ', '').replace('-', '').lower(): company.title() for company in _PHARMA_COMPANIES
+}
+_NORM_COMPANY_KEYS = tuple(_NORM_COMPANY_MAP)
+
+# With parallel processing enabled, lists with more papers than this are classified in a process pool.
+# Serial classification takes well under a millisecond per paper, so smaller lists finish before the
+# workers (each starting with an empty affiliation cache) have paid back their startup and pickling cost
+_PARALLEL_THRESHOLD = 5000
+_PARALLEL_CHUNKSIZE = 32
+
+# RE2's \b, \s and \w only recognise ASCII, so the standard library engine is put in ASCII mode as well
+# to classify affiliations identically whichever engine is installed (flags are set inline since RE2
+# does not accept `re` flags)
+_ASCII_FLAG = "" if _re.__name__ == "re2" else "(?a)"
+
+# Unicode whitespace seen in PubMed affiliations (e.g. no-break spaces), replaced with plain spaces before
+# matching since ASCII-only \s and \b would not treat it as whitespace
+_UNICODE_WHITESPACE = str.maketrans(dict.fromkeys(
+    "\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000",
+    " "
+))
+
+# Combine each indicator list into a single alternation so every affiliation is scanned once
+_PHARMA_RE = _re.compile(_ASCII_FLAG + "(?i)" + "|".join(f"(?:{p})" for p in _PHARMA_INDICATORS))
+_ACADEMIC_RE = _re.compile(_ASCII_FLAG + "(?i)" + "|".join(f"(?:{p})" for p in _ACADEMIC_INDICATORS))
+
+# Patterns used to pull a company name out of an affiliation string
+# Pattern: [Name] Pharmaceuticals/Biotech/Therapeutics...
+_COMPANY_PHARMA_RE = _re.compile(
+    _ASCII_FLAG
+    + r'([A-Z][a-zA-Z0-9\s&\-]+)\s+(?:Pharma(?:ceutical)?s?|Biotech|Therapeutics|Biosciences|Labs?|Laboratories)')
+# Pattern: [Name], Inc./LLC/Ltd./Corp./Corporation
+_COMPANY_CORP_RE = _re.compile(
+    _ASCII_FLAG
+    + r'([A-Z][a-zA-Z0-9\s&\-]+)(?:,\s+Inc\.?|,\s+LLC\.?|,\s+Ltd\.?|,\s+Corp\.?|,\s+Corporation)')
+
+# Literal keywords each pattern above requires; checking for them first avoids running
+# the backtracking searches on the many affiliations that cannot match
+_COMPANY_PHARMA_KEYWORDS = ('Pharma', 'Biotech', 'Therapeutics', 'Biosciences', 'Lab')
+_COMPANY_CORP_KEYWORDS = ('Inc', 'LLC', 'Ltd', 'Corp')
+
+
+def _normalize_whitespace(affiliation: str) -> str:
+    """
+    Replace Unicode whitespace in an affiliation with plain spaces.
+
+    Args:
+        affiliation: Affiliation string
+
+    Returns:
+        Affiliation string containing only ASCII whitespace
+    """
+    if affiliation.isascii():
+        return affiliation
+    return affiliation.translate(_UNICODE_WHITESPACE)
+
+
+def _build_company_automaton() -> Optional[Any]:
+    """
+    Build an Aho-Corasick automaton that finds every known company in a single pass over an affiliation.
+
+    Returns:
+        The automaton, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for company in _PHARMA_COMPANIES:
+        automaton.add_word(company, company)
+    automaton.make_automaton()
+    return automaton
+
+
+_COMPANY_AUTOMATON = _build_company_automaton()
+
+
+def _find_known_companies(aff_lower: str) -> List[str]:
+    """
+    Find the known pharmaceutical companies mentioned in an affiliation.
+
+    Args:
+        aff_lower: Lowercased affiliation string
+
+    Returns:
+        List of matching company names (lowercase, without duplicates)
+    """
+    if _COMPANY_AUTOMATON is not None:
+        return list(dict.fromkeys(company for _, company in _COMPANY_AUTOMATON.iter(aff_lower)))
+
+    return [company for company in _PHARMA_COMPANIES if company in aff_lower]
+
+
+def _company_from_affiliation(affiliation: str, known_companies: List[str]) -> Optional[str]:
+    """
+    Attempt to extract company name from an affiliation string.
+
+    Args:
+        affiliation: Affiliation string
+        known_companies: Known companies found in the affiliation by _find_known_companies
+
+    Returns:
+        Extracted company name or None if not found
+    """
+    # First check for known companies
+    if known_companies:
+        return known_companies[0].title()
+
+    # Try to extract a company name based on common patterns
+    if any(keyword in affiliation for keyword in _COMPANY_PHARMA_KEYWORDS):
+        company_matches = _COMPANY_PHARMA_RE.search(affiliation)
+        if company_matches:
+            return company_matches.group(0)
+
+    if any(keyword in affiliation for keyword in _COMPANY_CORP_KEYWORDS):
+        company_matches = _COMPANY_CORP_RE.search(affiliation)
+        if company_matches:
+            return company_matches.group(1)
+
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _classify_affiliation(affiliation: str) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Classify a single affiliation, memoized since co-authors and papers often share affiliations.
+
+    Args:
+        affiliation: Affiliation string (case is kept since company name extraction relies on it)
+
+    Returns:
+        Tuple containing:
+            - Whether the affiliation is pharmaceutical/biotech
+            - Company names found in the affiliation
+    """
+    affiliation = _normalize_whitespace(affiliation)
+
+    # Scan for known companies once; both branches below reuse the result
+    known_companies = _find_known_companies(affiliation.lower())
+
+    # Skip if clear academic affiliation
+    if _ACADEMIC_RE.search(affiliation):
+        # Check if affiliation also contains a pharma company name
+        # (for cases of joint academic-industry affiliations)
+        if not known_companies:
+            # Skip clearly academic affiliations
+            return False, ()
+
+        # Already classified; the pharma indicator check would only find the same known company again
+        return True, tuple(company.title() for company in known_companies)
+
+    # Check for pharma indicators
+    if _PHARMA_RE.search(affiliation):
+        # Try to extract company name
+        company_name = _company_from_affiliation(affiliation, known_companies)
+        return True, (company_name,) if company_name else ()
+
+    return False, ()
+
+
+def _company_from_email_domain(domain: str) -> Optional[str]:
+    """
+    Attempt to extract company name from an email domain.
+
+    Args:
+        domain: Email domain (e.g., "company.com")
+
+    Returns:
+        Extracted company name or None if not extractable
+    """
+    # Remove common TLDs and extract the main domain
+    parts = domain.split('.')
+    if len(parts) >= 2:
+        main_domain = parts[-2]
+
+        # Check if the domain is a known pharma company
+        company = _NORM_COMPANY_MAP.get(main_domain)
+        if company:
+            return company
+
+        for normalized_company in _NORM_COMPANY_KEYS:
+            if normalized_company in main_domain or main_domain in normalized_company:
+                return _NORM_COMPANY_MAP[normalized_company]
+
+        # If not a known company, return capitalized domain
+        return main_domain.title()
+
+    return None
+
+
+def _available_cpus() -> int:
+    """
+    Count the CPUs this process is allowed to run on.
+
+    Returns:
+        Number of usable CPUs
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is not available on macOS and Windows
+        return os.cpu_count() or 1
+
+
+def _identify_pharma_authors(paper: Dict[str, Any]) -> Tuple[List[str], Set[str], List[str]]:
+    """
+    Identify authors affiliated with pharmaceutical or biotech companies in a paper.
+
+    Defined at module level so it can be sent to worker processes.
+
+    Args:
+        paper: Paper details dictionary
+
+    Returns:
+        Tuple containing:
+            - List of names of authors with pharmaceutical affiliations
+            - Set of pharmaceutical company names
+            - List of corresponding author emails
+    """
+    non_academic_authors = []
+    company_affiliations = set()
+    corresponding_emails = []
+
+    for author in paper.get("authors", []):
+        name = author.get("name", "")
+        email = author.get("email")
+        affiliations = author.get("affiliations", [])
+
+        is_pharma_author = False
+        author_companies: List[str] = []
+
+        for affiliation in affiliations:
+            if not affiliation:
+                continue
+
+            is_pharma_affiliation, companies = _classify_affiliation(affiliation)
+            if is_pharma_affiliation:
+                is_pharma_author = True
+                author_companies.extend(companies)
+
+        # Check email domain if available (as an additional signal)
+        if email and "@" in email:
+            domain = email.split("@")[1].lower()
+            if not any(ac_indicator in domain for ac_indicator in ['edu', 'ac.', 'gov']):
+                # Corporate/commercial email domains
+                is_pharma_author = True
+
+                # Extract company name from email domain if possible
+                company_from_email = _company_from_email_domain(domain)
+                if company_from_email:
+                    author_companies.append(company_from_email)
+
+        if is_pharma_author:
+            non_academic_authors.append(name)
+            company_affiliations.update(author_companies)
+            if email:
+                corresponding_emails.append(email)
+
+    return non_academic_authors, company_affiliations, corresponding_emails
+
 
 class PaperProcessor:
     """
     Processes PubMed paper data to identify authors with pharmaceutical or biotech affiliations.
+
+    Classification always uses the module-level indicator and company tables and their precompiled patterns.
+    The pharma_indicators, academic_indicators and pharma_companies properties expose those tables read-only;
+    they cannot be customized per instance.
     """
 
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, parallel: bool = False):
         """
         Initialize the paper processor.
 
         Args:
             debug: Enable debug logging
+            parallel: Classify very large paper lists in a process pool when more than one CPU is available.
+                Scripts that enable this must guard their entry point with `if __name__ == "__main__":`,
+                since worker processes may be started by re-importing the main module
         """
         # Set logging level based on debug flag
         if debug:
             logger.setLevel(logging.DEBUG)
 
-        # Common pharmaceutical/biotech company identifiers in affiliations
-        self.pharma_indicators = [
-            r'\b(?:pharma(?:ceutical)?s?|biotech|therapeutics|biosciences)\b',
-            r'\binc\.?\b|\bllc\.?\b|\bltd\.?\b|\bcorp\.?\b|\bcorporation\b',
-            r'\blaborator(?:y|ies)\b',
-            r'\bmedical\s+research\b',
-            r'\bbiopharm(?:a|aceutical)?\b',
-            r'\bbiolog(?:y|ical)s?\b',
-            r'\blife\s+sciences\b',
-            r'\bhealth(?:care)?\b',
-            r'\bmedicine[s]?\b',
-            r'\bgenetics\b',
-            r'\btherapeutics\b',
-            r'\btechnology\b'
-        ]
-
-        # Common academic institution identifiers to exclude
-        self.academic_indicators = [
-            r'\buniversity\b|\bcollege\b|\bcampus\b',
-            r'\bschool\s+of\b',
-            r'\bacadem(?:y|ic)\b',
-            r'\binstitut(?:e|ion)\b',
-            r'\bdepartment\b|\bdept\.?\b',
-            r'\bhospital\b',
-            r'\bmedical\s+center\b|\bhealth\s+center\b',
-            r'\bclinic(?:al)?\b',
-            r'\bschool\b',
-            r'\bfaculty\b',
-            r'\bcampus\b',
-            r'\bprofessor\b',
-            r'\bedu\b'
-        ]
-
-        # Known major pharmaceutical companies
-        self.pharma_companies = {
-            'pfizer', 'merck', 'novartis', 'roche', 'sanofi', 'johnson & johnson', 'j&j',
-            'glaxosmithkline', 'gsk', 'astrazeneca', 'abbvie', 'lilly', 'eli lilly',
-            'bristol-myers squibb', 'bms', 'amgen', 'gilead', 'biogen',
-            'bayer', 'boehringer', 'takeda', 'astellas', 'daiichi', 'eisai',
-            'genentech', 'regeneron', 'moderna', 'biontech', 'curevac',
-            'vertex', 'alexion', 'celgene', 'shire', 'incyte', 'seagen',
-            'novavax', 'biomarin', 'alkermes', 'viatris', 'teva',
-            'jazz', 'united therapeutics', 'ionis', 'allogene', 'bluebird bio'
-        }
+        self.parallel = parallel
 
         logger.debug("Paper processor initialized")
 
+    @property
+    def pharma_indicators(self) -> Tuple[str, ...]:
+        """Regex patterns that mark an affiliation as pharmaceutical/biotech."""
+        return _PHARMA_INDICATORS
+
+    @property
+    def academic_indicators(self) -> Tuple[str, ...]:
+        """Regex patterns that mark an affiliation as academic."""
+        return _ACADEMIC_INDICATORS
+
+    @property
+    def pharma_companies(self) -> FrozenSet[str]:
+        """Known pharmaceutical company names (lowercase)."""
+        return _PHARMA_COMPANIES
+
     def process_papers(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Process a list of papers to identify those with pharmaceutical company affiliations.
 
+        When parallel processing is enabled, very large lists are processed across CPU cores.
+
         Args:
             papers: List of paper detail dictionaries
 
@@ -86,11 +385,18 @@ class PaperProcessor:
         """
         logger.debug(f"Processing {len(papers)} papers to identify pharmaceutical affiliations")
 
-        pharma_papers = []
+        if self.parallel and len(papers) > _PARALLEL_THRESHOLD and _available_cpus() > 1:
+            # Imported here since multiprocessing is only needed for large batches
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_identify_pharma_authors, papers, chunksize=_PARALLEL_CHUNKSIZE))
+        else:
+            results = [_identify_pharma_authors(paper) for paper in papers]
 
-        for paper in papers:
-            non_academic_authors, company_affiliations, corresponding_emails = self._identify_pharma_authors(paper)
+        pharma_papers = []
 
+        for paper, (non_academic_authors, company_affiliations, corresponding_emails) in zip(papers, results):
             if non_academic_authors:
                 # Add processed information to the paper
                 paper_with_pharma = {
@@ -120,63 +426,7 @@ class PaperProcessor:
                 - Set of pharmaceutical company names
                 - List of corresponding author emails
         """
-        non_academic_authors = []
-        company_affiliations = set()
-        corresponding_emails = []
-
-        for author in paper.get("authors", []):
-            name = author.get("name", "")
-            email = author.get("email")
-            affiliations = author.get("affiliations", [])
-
-            is_pharma_author = False
-            author_companies = []
-
-            for affiliation in affiliations:
-                if not affiliation:
-                    continue
-
-                # Skip if clear academic affiliation
-                if any(re.search(pattern, affiliation, re.IGNORECASE) for pattern in self.academic_indicators):
-                    # Check if affiliation also contains a pharma company name
-                    # (for cases of joint academic-industry affiliations)
-                    if any(company in affiliation.lower() for company in self.pharma_companies):
-                        is_pharma_author = True
-                        for company in self.pharma_companies:
-                            if company in affiliation.lower():
-                                author_companies.append(company.title())
-                    else:
-                        # Skip clearly academic affiliations
-                        continue
-
-                # Check for pharma indicators
-                if any(re.search(pattern, affiliation, re.IGNORECASE) for pattern in self.pharma_indicators):
-                    is_pharma_author = True
-
-                    # Try to extract company name
-                    company_name = self._extract_company_name(affiliation)
-                    if company_name:
-                        author_companies.append(company_name)
-
-            # Check email domain if available (as an additional signal)
-            if email and "@" in email:
-                domain = email.split("@")[1].lower()
-                if not any(ac_indicator in domain for ac_indicator in ['edu', 'ac.', 'gov']):
-                    # Corporate/commercial email domains
-                    is_pharma_author = True
-
-                    # Extract company name from email domain if possible
-                    company_from_email = self._extract_company_from_email(domain)
-                    if company_from_email:
-                        author_companies.append(company_from_email)
-
-            if is_pharma_author:
-                non_academic_authors.append(name)
-                company_affiliations.update(author_companies)
-                if email:
-                    corresponding_emails.append(email)
-
-        return non_academic_authors, company_affiliations, corresponding_emails
+        return _identify_pharma_authors(paper)
 
     def _extract_company_name(self, affiliation: str) -> Optional[str]:
         """
@@ -188,26 +438,8 @@ class PaperProcessor:
         Returns:
             Extracted company name or None if not found
         """
-        # First check for known companies
-        for company in self.pharma_companies:
-            if company in affiliation.lower():
-                return company.title()
-
-        # Try to extract a company name based on common patterns
-        # Pattern: [Name] Pharmaceuticals/Biotech/Therapeutics...
-        company_matches = re.search(
-            r'([A-Z][a-zA-Z0-9\s&\-]+)\s+(?:Pharma(?:ceutical)?s?|Biotech|Therapeutics|Biosciences|Labs?|Laboratories)',
-            affiliation)
-        if company_matches:
-            return company_matches.group(0)
-
-        # Pattern: [Name], Inc./LLC/Ltd./Corp./Corporation
-        company_matches = re.search(
-            r'([A-Z][a-zA-Z0-9\s&\-]+)(?:,\s+Inc\.?|,\s+LLC\.?|,\s+Ltd\.?|,\s+Corp\.?|,\s+Corporation)', affiliation)
-        if company_matches:
-            return company_matches.group(1)
-
-        return None
+        affiliation = _normalize_whitespace(affiliation)
+        return _company_from_affiliation(affiliation, _find_known_companies(affiliation.lower()))
 
     def _extract_company_from_email(self, domain: str) -> Optional[str]:
         """
@@ -219,18 +451,4 @@ class PaperProcessor:
         Returns:
             Extracted company name or None if not extractable
         """
-        # Remove common TLDs and extract the main domain
-        parts = domain.split('.')
-        if len(parts) >= 2:
-            main_domain = parts[-2]
-
-            # Check if the domain is a known pharma company
-            for company in self.pharma_companies:
-                normalized_company = company.replace(' ', '').replace('-', '').lower()
-                if normalized_company in main_domain or main_domain in normalized_company:
-                    return company.title()
-
-            # If not a known company, return capitalized domain
-            return main_domain.title()
-
-        return None
+        return _company_from_email_domain(domain)
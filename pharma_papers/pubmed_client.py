@@ -3,15 +3,87 @@ PubMed client module for fetching paper data from the PubMed API.
 """
 
 import logging
+import re
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any
+from xml.etree import ElementTree
 
-from Bio import Entrez
+if TYPE_CHECKING:
+    from Bio import Entrez
+else:
+    # Biopython's Entrez module is slow to import, so it is loaded on first use by _load_entrez
+    Entrez = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# EFetch endpoint, requested directly so responses can be gzip-compressed and streamed
+_EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+
+# Timeout in seconds for HTTP requests to the E-utilities
+_REQUEST_TIMEOUT = 60
+
+# Email addresses embedded in affiliation strings
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+
+
+def _element_text(element: Optional[ElementTree.Element]) -> str:
+    """
+    Get the full text of an XML element, including text nested in inline markup (e.g. <i>, <sup>).
+
+    Args:
+        element: XML element, or None if it was not present
+
+    Returns:
+        Concatenated text content, or an empty string if the element is missing
+    """
+    if element is None:
+        return ""
+    return "".join(element.itertext())
+
+
+def _load_entrez() -> Any:
+    """
+    Import Biopython's Entrez module the first time it is needed.
+
+    Returns:
+        The Bio.Entrez module
+    """
+    global Entrez
+    if Entrez is None:
+        from Bio import Entrez
+    return Entrez
+
+
+class _RateLimiter:
+    """
+    Thread-safe limiter that spaces requests evenly to stay under a requests-per-second budget.
+    """
+
+    def __init__(self, requests_per_second: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_second: Maximum number of requests allowed per second
+        """
+        self.interval = 1.0 / requests_per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """
+        Block until the caller may issue its next request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
+
 
 class PubMedClient:
     """
@@ -34,11 +106,26 @@ class PubMedClient:
         self.debug = debug
 
         # Configure Entrez
+        Entrez = _load_entrez()
         Entrez.email = email
         Entrez.tool = tool
         if api_key:
             Entrez.api_key = api_key
 
+        # NCBI allows 10 requests per second with an API key, 3 without
+        self.max_requests_per_second = 10 if api_key else 3
+        self._rate_limiter = _RateLimiter(self.max_requests_per_second)
+
+        # requests is imported here rather than at module level to keep CLI startup fast
+        import requests
+
+        # HTTP session reused across EFetch requests; PubMed XML compresses well, so ask for gzip
+        self._session = requests.Session()
+        self._session.headers["Accept-Encoding"] = "gzip"
+
+        # Paper details already fetched by this client, keyed by PubMed ID
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
         # Set logging level based on debug flag
         if debug:
             logger.setLevel(logging.DEBUG)
@@ -63,6 +150,7 @@ class PubMedClient:
         while attempt < retries:
             try:
                 # Search PubMed
+                Entrez = _load_entrez()
                 handle = Entrez.esearch(
                     db="pubmed",
                     term=query,
@@ -87,13 +175,15 @@ class PubMedClient:
 
         return []  # This should never be reached due to the raise above, but keeps mypy happy
 
-    def fetch_details(self, id_list: List[str], batch_size: int = 50, retries: int = 3) -> List[Dict[str, Any]]:
+    def fetch_details(self, id_list: List[str], batch_size: int = 200, retries: int = 3) -> List[Dict[str, Any]]:
         """
         Fetch detailed information for a list of PubMed IDs.
 
+        Duplicate IDs are fetched once, and papers already fetched by this client are served from memory.
+
         Args:
             id_list: List of PubMed IDs
-            batch_size: Number of records to fetch in each batch
+            batch_size: Number of records to fetch in each batch (EFetch handles 200 IDs per request comfortably)
             retries: Number of retry attempts for API calls
 
         Returns:
@@ -101,129 +191,250 @@ class PubMedClient:
         """
         logger.debug(f"Fetching details for {len(id_list)} papers")
 
-        papers = []
-        for i in range(0, len(id_list), batch_size):
-            batch_ids = id_list[i:i + batch_size]
-            logger.debug(f"Fetching batch of {len(batch_ids)} papers (IDs {i} to {i + len(batch_ids) - 1})")
-
-            attempt = 0
-            while attempt < retries:
-                try:
-                    # Fetch paper details
-                    handle = Entrez.efetch(
-                        db="pubmed",
-                        id=",".join(batch_ids),
-                        retmode="xml"
-                    )
-                    records = Entrez.read(handle)
-                    handle.close()
-
-                    # Process paper details
-                    for paper in records["PubmedArticle"]:
-                        paper_details = self._extract_paper_details(paper)
-                        papers.append(paper_details)
-
-                    break  # Successful, exit retry loop
-
-                except Exception as e:
-                    attempt += 1
-                    logger.warning(f"Error fetching paper details (attempt {attempt}/{retries}): {e}")
-                    if attempt < retries:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                    else:
-                        logger.error("Failed to fetch paper details after maximum retries")
-                        raise
-
-            # Respect NCBI rate limits (10 requests per second with an API key, 3 without)
-            time.sleep(0.1 if self.api_key else 0.34)
+        id_list = list(dict.fromkeys(id_list))
+        missing_ids = [pubmed_id for pubmed_id in id_list if pubmed_id not in self._cache]
+        if len(missing_ids) < len(id_list):
+            logger.debug(f"Reusing cached details for {len(id_list) - len(missing_ids)} papers")
+
+        for paper in self._fetch_in_batches(self._efetch_batch, missing_ids, batch_size, retries):
+            self._cache[paper["pubmed_id"]] = paper
+
+        papers = [self._cache[pubmed_id] for pubmed_id in id_list if pubmed_id in self._cache]
 
         logger.debug(f"Successfully fetched details for {len(papers)} papers")
         return papers
 
-    def _extract_paper_details(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+    def fetch_summary(self, id_list: List[str], batch_size: int = 200, retries: int = 3) -> List[Dict[str, Any]]:
+        """
+        Fetch summary information (title, publication date and author names) for a list of PubMed IDs.
+
+        ESummary records are roughly a tenth of the size of full EFetch records, so this is much cheaper
+        when only metadata is needed. Summaries carry no affiliations, emails or abstracts, so the
+        returned papers cannot be used to identify pharmaceutical affiliations; use fetch_details for that.
+
+        Args:
+            id_list: List of PubMed IDs
+            batch_size: Number of records to fetch in each batch
+            retries: Number of retry attempts for API calls
+
+        Returns:
+            List of paper dictionaries in the same shape as fetch_details, with empty affiliations
+        """
+        logger.debug(f"Fetching summaries for {len(id_list)} papers")
+
+        papers = self._fetch_in_batches(self._esummary_batch, id_list, batch_size, retries)
+
+        logger.debug(f"Successfully fetched summaries for {len(papers)} papers")
+        return papers
+
+    def _fetch_in_batches(self, fetch_batch: Callable[[List[str]], List[Dict[str, Any]]], id_list: List[str],
+                          batch_size: int, retries: int) -> List[Dict[str, Any]]:
+        """
+        Split a list of PubMed IDs into batches and fetch them concurrently.
+
+        Args:
+            fetch_batch: Function fetching the papers for one batch of IDs
+            id_list: List of PubMed IDs
+            batch_size: Number of records to fetch in each batch
+            retries: Number of retry attempts for API calls
+
+        Returns:
+            List of paper dictionaries, in the order of id_list
+        """
+        batches = [id_list[i:i + batch_size] for i in range(0, len(id_list), batch_size)]
+
+        # Batches are fetched concurrently; the shared rate limiter keeps requests within NCBI limits
+        max_workers = max(1, min(len(batches), self.max_requests_per_second))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda batch_index: self._fetch_batch(
+                    fetch_batch, batches[batch_index], batch_index * batch_size, retries),
+                range(len(batches))
+            )
+            return [paper for batch_papers in results for paper in batch_papers]
+
+    def _fetch_batch(self, fetch_batch: Callable[[List[str]], List[Dict[str, Any]]], batch_ids: List[str],
+                     start: int, retries: int) -> List[Dict[str, Any]]:
+        """
+        Fetch a single batch of PubMed IDs, retrying on errors.
+
+        Args:
+            fetch_batch: Function fetching the papers for one batch of IDs
+            batch_ids: List of PubMed IDs in this batch
+            start: Position of the first ID of the batch within the full ID list
+            retries: Number of retry attempts for API calls
+
+        Returns:
+            List of paper dictionaries for the batch
+        """
+        logger.debug(f"Fetching batch of {len(batch_ids)} papers (IDs {start} to {start + len(batch_ids) - 1})")
+
+        attempt = 0
+        while attempt < retries:
+            try:
+                self._rate_limiter.wait()
+                return fetch_batch(batch_ids)
+
+            except Exception as e:
+                attempt += 1
+                logger.warning(f"Error fetching papers (attempt {attempt}/{retries}): {e}")
+                if attempt < retries:
+                    time.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    logger.error("Failed to fetch papers after maximum retries")
+                    raise
+
+        return []  # This should never be reached due to the raise above, but keeps mypy happy
+
+    def _efetch_batch(self, batch_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch full paper records for a batch of PubMed IDs with EFetch.
+
+        Args:
+            batch_ids: List of PubMed IDs in this batch
+
+        Returns:
+            List of paper details dictionaries for the batch
+        """
+        params = {
+            "db": "pubmed",
+            "id": ",".join(batch_ids),
+            "retmode": "xml",
+            "tool": self.tool,
+            "email": self.email
+        }
+        if self.api_key:
+            params["api_key"] = self.api_key
+
+        with self._session.post(_EFETCH_URL, data=params, stream=True, timeout=_REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+
+            # Decompress the gzip-encoded body on the fly while it is being parsed
+            response.raw.decode_content = True
+
+            # Stream-parse the response so only one article tree is held in memory at a time
+            papers = []
+            for _, element in ElementTree.iterparse(response.raw, events=("end",)):
+                if element.tag == "PubmedArticle":
+                    papers.append(self._extract_paper_details(element))
+                    element.clear()
+            return papers
+
+    def _esummary_batch(self, batch_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch paper summaries for a batch of PubMed IDs with ESummary.
+
+        Args:
+            batch_ids: List of PubMed IDs in this batch
+
+        Returns:
+            List of paper summary dictionaries for the batch
+        """
+        Entrez = _load_entrez()
+        handle = Entrez.esummary(
+            db="pubmed",
+            id=",".join(batch_ids)
+        )
+        try:
+            records = Entrez.read(handle)
+        finally:
+            handle.close()
+
+        return [
+            {
+                "pubmed_id": str(summary["Id"]),
+                "title": str(summary.get("Title", "")),
+                # ESummary dates look like "2023 Jan 15"; match the Year/Month/Day format of fetch_details
+                "publication_date": "/".join(str(summary.get("PubDate", "")).split()),
+                "authors": [
+                    {"name": str(author), "affiliations": [], "email": None}
+                    for author in summary.get("AuthorList", [])
+                ],
+                "abstract": ""
+            }
+            for summary in records
+        ]
+
+    def _extract_paper_details(self, paper: ElementTree.Element) -> Dict[str, Any]:
         """
         Extract relevant details from a PubMed paper record.
 
         Args:
-            paper: PubMed paper record
+            paper: PubMed paper record (a <PubmedArticle> XML element)
 
         Returns:
             Dictionary with extracted paper details
         """
         try:
-            article = paper["MedlineCitation"]["Article"]
+            citation = paper.find("MedlineCitation")
+            article = citation.find("Article") if citation is not None else None
+            if citation is None or article is None:
+                raise ValueError("missing MedlineCitation/Article")
 
             # Extract basic information
-            pubmed_id = paper["MedlineCitation"]["PMID"]
-            title = article.get("ArticleTitle", "")
+            pubmed_id = citation.findtext("PMID", "")
+            title = _element_text(article.find("ArticleTitle"))
 
             # Extract publication date
             pub_date = ""
-            if "PubDate" in article.get("Journal", {}).get("JournalIssue", {}).get("PubDate", {}):
-                pub_date_dict = article["Journal"]["JournalIssue"]["PubDate"]
-                year = pub_date_dict.get("Year", "")
-                month = pub_date_dict.get("Month", "")
-                day = pub_date_dict.get("Day", "")
-
-                pub_date_parts = [part for part in [year, month, day] if part]
-                pub_date = "/".join(pub_date_parts)
+            pub_date_element = article.find("Journal/JournalIssue/PubDate")
+            if pub_date_element is not None:
+                year = pub_date_element.findtext("Year", "")
+                month = pub_date_element.findtext("Month", "")
+                day = pub_date_element.findtext("Day", "")
+                pub_date = "/".join(part for part in (year, month, day) if part)
 
             # Extract authors
             authors = []
-            author_list = article.get("AuthorList", [])
-            if isinstance(author_list, list):
-                for author in author_list:
-                    if not isinstance(author, dict):
-                        continue
-
-                    author_name = ""
-                    if "LastName" in author and "ForeName" in author:
-                        author_name = f"{author['LastName']} {author['ForeName']}"
-                    elif "LastName" in author and "Initials" in author:
-                        author_name = f"{author['LastName']} {author['Initials']}"
-                    elif "LastName" in author:
-                        author_name = author['LastName']
-                    elif "CollectiveName" in author:
-                        author_name = author['CollectiveName']
-
-                    # Extract author affiliation
-                    affiliations = []
-                    if "AffiliationInfo" in author:
-                        for affiliation in author["AffiliationInfo"]:
-                            if "Affiliation" in affiliation:
-                                affiliations.append(affiliation["Affiliation"])
-
-                    # Extract author email
-                    email = None
-                    for affiliation in affiliations:
-                        # Common patterns for emails in affiliations
-                        if "@" in affiliation:
-                            parts = affiliation.split()
-                            for part in parts:
-                                if "@" in part and "." in part:
-                                    email = part.strip(".,;()[]<>{}")
-
-                    authors.append({
-                        "name": author_name,
-                        "affiliations": affiliations,
-                        "email": email
-                    })
+            for author in article.iterfind("AuthorList/Author"):
+                last_name = author.findtext("LastName")
+                fore_name = author.findtext("ForeName")
+                initials = author.findtext("Initials")
+                collective_name = author.findtext("CollectiveName")
+
+                author_name = ""
+                if last_name is not None and fore_name is not None:
+                    author_name = f"{last_name} {fore_name}"
+                elif last_name is not None and initials is not None:
+                    author_name = f"{last_name} {initials}"
+                elif last_name is not None:
+                    author_name = last_name
+                elif collective_name is not None:
+                    author_name = collective_name
+
+                # Extract author affiliation
+                affiliations = [
+                    _element_text(affiliation) for affiliation in author.iterfind("AffiliationInfo/Affiliation")
+                ]
+
+                # Extract author email
+                email = None
+                for affiliation in affiliations:
+                    email_match = _EMAIL_RE.search(affiliation)
+                    if email_match:
+                        email = email_match.group(0).rstrip(".,;()[]<>{}")
+                        break
+
+                authors.append({
+                    "name": author_name,
+                    "affiliations": affiliations,
+                    "email": email
+                })
 
             return {
                 "pubmed_id": pubmed_id,
                 "title": title,
                 "publication_date": pub_date,
                 "authors": authors,
-                "abstract": article.get("Abstract", {}).get("AbstractText", [""])[0] if isinstance(
-                    article.get("Abstract", {}).get("AbstractText", []), list) else ""
+                "abstract": _element_text(article.find("Abstract/AbstractText"))
             }
 
         except Exception as e:
-            logger.warning(
-                f"Error extracting paper details (PMID: {paper.get('MedlineCitation', {}).get('PMID', 'unknown')}): {e}")
+            pubmed_id = paper.findtext("MedlineCitation/PMID", "unknown")
+            logger.warning(f"Error extracting paper details (PMID: {pubmed_id}): {e}")
             # Return minimal information to avoid breaking the pipeline
             return {
-                "pubmed_id": paper.get("MedlineCitation", {}).get("PMID", "unknown"),
+                "pubmed_id": pubmed_id,
                 "title": "Error extracting paper details",
                 "publication_date": "",
                 "authors": [],
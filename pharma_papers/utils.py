@@ -6,30 +6,33 @@ import csv
 import logging
 import os
 import sys
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, TextIO
 
-import pandas as pd
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Column headers of the exported CSV
+_CSV_COLUMNS = [
+    'PubmedID',
+    'Title',
+    'Publication Date',
+    'Non-academic Author(s)',
+    'Company Affiliation(s)',
+    'Corresponding Author Email'
+]
 
-def export_to_csv(papers: List[Dict[str, Any]], filename: Optional[str] = None) -> Optional[str]:
+
+def _rows(papers: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, str]]:
     """
-    Export papers to a CSV file or print to console.
+    Lazily convert papers into CSV rows.
 
     Args:
-        papers: List of paper dictionaries to export
-        filename: Output filename (if None, prints to console)
+        papers: Paper dictionaries to export
 
-    Returns:
-        Path to the saved file if filename is provided, None otherwise
+    Yields:
+        CSV row dictionaries keyed by column header
     """
-    # Prepare data for CSV
-    data = []
     for paper in papers:
-        row = {
+        yield {
             'PubmedID': paper.get('pubmed_id', ''),
             'Title': paper.get('title', ''),
             'Publication Date': paper.get('publication_date', ''),
@@ -37,11 +40,32 @@ def export_to_csv(papers: List[Dict[str, Any]], filename: Optional[str] = None)
             'Company Affiliation(s)': '; '.join(paper.get('company_affiliations', [])),
             'Corresponding Author Email': paper.get('corresponding_author_email', '')
         }
-        data.append(row)
 
-    # Convert to DataFrame for easier handling
-    df = pd.DataFrame(data)
 
+def _write_csv(papers: Iterable[Dict[str, Any]], output: TextIO) -> None:
+    """
+    Write papers as CSV rows to an open text stream.
+
+    Args:
+        papers: Paper dictionaries to export
+        output: Text stream to write to
+    """
+    writer = csv.DictWriter(output, fieldnames=_CSV_COLUMNS, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(_rows(papers))
+
+
+def export_to_csv(papers: List[Dict[str, Any]], filename: Optional[str] = None) -> Optional[str]:
+    """
+    Export papers to a CSV file or print to console.
+
+    Args:
+        papers: List of paper dictionaries to export
+        filename: Output filename (if None, prints to console)
+
+    Returns:
+        Path to the saved file if filename is provided, None otherwise
+    """
     if filename:
         try:
             # Ensure directory exists
@@ -50,16 +74,17 @@ def export_to_csv(papers: List[Dict[str, Any]], filename: Optional[str] = None)
                 os.makedirs(output_dir)
 
             # Write to CSV
-            df.to_csv(filename, index=False, quoting=csv.QUOTE_NONNUMERIC)
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                _write_csv(papers, f)
             logger.info(f"Results saved to {filename}")
             return filename
         except Exception as e:
             logger.error(f"Error saving results to {filename}: {e}")
             print(f"Error saving results: {e}", file=sys.stderr)
             # Fall back to printing to console
-            print(df.to_csv(index=False, quoting=csv.QUOTE_NONNUMERIC))
+            _write_csv(papers, sys.stdout)
             return None
     else:
         # Print to console
-        print(df.to_csv(index=False, quoting=csv.QUOTE_NONNUMERIC))
+        _write_csv(papers, sys.stdout)
         return None
@@ -0,0 +1,143 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from typer.testing import CliRunner
+
+try:
+    import coverage
+except ImportError:
+    coverage = None
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Pause coverage measurement while running tests marked no_cover."""
+    cov = coverage.Coverage.current() if coverage is not None else None
+    # pytest-cov honours no_cover itself, so only step in when coverage is driven some other way
+    if cov is None or item.get_closest_marker("no_cover") is None or item.config.pluginmanager.hasplugin("_cov"):
+        return (yield)
+
+    cov.stop()
+    try:
+        return (yield)
+    finally:
+        cov.start()
+
+
+@pytest.fixture(autouse=True)
+def _no_log_capture(caplog):
+    """Drop log records during tests unless a test lowers the level itself."""
+    caplog.set_level(logging.CRITICAL + 1)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """CLI runner that keeps stderr separate from stdout, shared since it holds no per-invocation state."""
+    return CliRunner(mix_stderr=False)
+
+
+@pytest.fixture(scope="module")
+def patched_cli_deps():
+    """Patch the CLI's PubMed client, paper processor and CSV export once per test module."""
+    deps = SimpleNamespace(client=MagicMock(), processor=MagicMock(), export=MagicMock())
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("pharma_papers.cli.PubMedClient", deps.client)
+        monkeypatch.setattr("pharma_papers.cli.PaperProcessor", deps.processor)
+        monkeypatch.setattr("pharma_papers.cli.export_to_csv", deps.export)
+        yield deps
+
+
+@pytest.fixture
+def cli_deps(patched_cli_deps):
+    """Reset the patched CLI dependencies so the client finds two papers and the processor keeps one."""
+    for mock in vars(patched_cli_deps).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+    patched_cli_deps.client.configure_mock(**{
+        "return_value.search.return_value": ["12345", "67890"],
+        "return_value.fetch_details.return_value": [{"pubmed_id": "12345"}, {"pubmed_id": "67890"}],
+    })
+    patched_cli_deps.processor.configure_mock(**{
+        "return_value.process_papers.return_value": [{"pubmed_id": "12345"}],
+    })
+    return patched_cli_deps
+
+
+@pytest.fixture(scope="session")
+def pharma_paper_sample():
+    """Sample paper with one pharmaceutical and one academic author."""
+    return {
+        "pubmed_id": "12345",
+        "title": "Test Pharmaceutical Paper",
+        "publication_date": "2023/01/01",
+        "authors": [
+            {
+                "name": "Smith, John",
+                "affiliations": ["Pfizer Inc., New York, NY, USA"],
+                "email": "john.smith@pfizer.com"
+            },
+            {
+                "name": "Johnson, Emily",
+                "affiliations": ["Harvard University, Boston, MA, USA"],
+                "email": "emily.johnson@harvard.edu"
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def academic_paper_sample():
+    """Sample paper with only academic authors."""
+    return {
+        "pubmed_id": "67890",
+        "title": "Test Academic Paper",
+        "publication_date": "2023/02/01",
+        "authors": [
+            {
+                "name": "Brown, Robert",
+                "affiliations": ["Stanford University, Stanford, CA, USA"],
+                "email": "robert.brown@stanford.edu"
+            },
+            {
+                "name": "Lee, Sarah",
+                "affiliations": ["MIT, Cambridge, MA, USA"],
+                "email": "sarah.lee@mit.edu"
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def mixed_affiliation_sample():
+    """Sample paper mixing academic, pharmaceutical and joint academic-industry affiliations."""
+    return {
+        "pubmed_id": "24680",
+        "title": "Test Mixed Affiliation Paper",
+        "publication_date": "2023/03/01",
+        "authors": [
+            {
+                "name": "White, Thomas",
+                "affiliations": [
+                    "Department of Biology, Yale University, New Haven, CT, USA",
+                    "Moderna Therapeutics, Cambridge, MA, USA"
+                ],
+                "email": "thomas.white@moderna.com"
+            },
+            {
+                "name": "Garcia, Maria",
+                "affiliations": ["Novartis Institutes for BioMedical Research, Basel, Switzerland"],
+                "email": "maria.garcia@novartis.com"
+            },
+            {
+                "name": "Wilson, David",
+                "affiliations": ["Johns Hopkins University School of Medicine, Baltimore, MD, USA"],
+                "email": "david.wilson@jhu.edu"
+            }
+        ]
+    }
@@ -2,75 +2,58 @@
 Tests for the CLI module.
 """
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import call
 
-from typer.testing import CliRunner
+import pytest
 
 from pharma_papers.cli import app
 
-runner = CliRunner()
+# The CLI's collaborators are mocked, so these tests add little coverage of the real code paths
+pytestmark = pytest.mark.no_cover
 
+# Expected calls into the mocked collaborators
+_EXPECTED_SEARCH_CALL = call("cancer", max_results=100)
+_EXPECTED_FETCH_CALL = call(["12345", "67890"])
+_EXPECTED_EXPORT_CALL = call([{"pubmed_id": "12345"}], None)
+_EXPECTED_FILE_EXPORT_CALL = call([{"pubmed_id": "12345"}], "output.csv")
 
-@patch("pharma_papers.cli.PubMedClient")
-@patch("pharma_papers.cli.PaperProcessor")
-@patch("pharma_papers.cli.export_to_csv")
-def test_cli_basic_query(mock_export, mock_processor, mock_client):
-    """Test the CLI with a basic query."""
-    # Setup mocks
-    mock_client_instance = MagicMock()
-    mock_client.return_value = mock_client_instance
-    mock_client_instance.search.return_value = ["12345", "67890"]
-    mock_client_instance.fetch_details.return_value = [{"pubmed_id": "12345"}, {"pubmed_id": "67890"}]
-
-    mock_processor_instance = MagicMock()
-    mock_processor.return_value = mock_processor_instance
-    mock_processor_instance.process_papers.return_value = [{"pubmed_id": "12345"}]
 
+def test_cli_basic_query(runner, cli_deps):
+    """Test the CLI with a basic query."""
     # Run the CLI
-    result = runner.invoke(app, ["cancer"])
+    result = runner.invoke(app, ["cancer"], catch_exceptions=False)
 
     # Verify the CLI runs successfully
     assert result.exit_code == 0
 
     # Verify the mocks were called correctly
-    mock_client_instance.search.assert_called_once_with("cancer", max_results=100)
-    mock_client_instance.fetch_details.assert_called_once_with(["12345", "67890"])
-    mock_processor_instance.process_papers.assert_called_once()
-    mock_export.assert_called_once_with([{"pubmed_id": "12345"}], None)
+    mock_client_instance = cli_deps.client.return_value
+    assert mock_client_instance.search.call_count == 1
+    assert mock_client_instance.search.call_args == _EXPECTED_SEARCH_CALL
+    assert mock_client_instance.fetch_details.call_count == 1
+    assert mock_client_instance.fetch_details.call_args == _EXPECTED_FETCH_CALL
+    assert cli_deps.processor.return_value.process_papers.call_count == 1
+    assert cli_deps.export.call_count == 1
+    assert cli_deps.export.call_args == _EXPECTED_EXPORT_CALL
 
 
-@patch("pharma_papers.cli.PubMedClient")
-@patch("pharma_papers.cli.PaperProcessor")
-@patch("pharma_papers.cli.export_to_csv")
-def test_cli_with_file_output(mock_export, mock_processor, mock_client):
+def test_cli_with_file_output(runner, cli_deps):
     """Test the CLI with file output specified."""
-    # Setup mocks
-    mock_client_instance = MagicMock()
-    mock_client.return_value = mock_client_instance
-    mock_client_instance.search.return_value = ["12345"]
-    mock_client_instance.fetch_details.return_value = [{"pubmed_id": "12345"}]
-
-    mock_processor_instance = MagicMock()
-    mock_processor.return_value = mock_processor_instance
-    mock_processor_instance.process_papers.return_value = [{"pubmed_id": "12345"}]
-
     # Run the CLI with file output
-    result = runner.invoke(app, ["cancer", "--file", "output.csv"])
+    result = runner.invoke(app, ["cancer", "--file", "output.csv"], catch_exceptions=False)
 
     # Verify the CLI runs successfully
     assert result.exit_code == 0
 
     # Verify the export was called with the correct filename
-    mock_export.assert_called_once_with([{"pubmed_id": "12345"}], "output.csv")
+    assert cli_deps.export.call_count == 1
+    assert cli_deps.export.call_args == _EXPECTED_FILE_EXPORT_CALL
 
 
-@patch("pharma_papers.cli.PubMedClient")
-def test_cli_no_results(mock_client):
+def test_cli_no_results(runner, cli_deps):
     """Test the CLI behavior when no results are found."""
     # Setup mocks to return empty results
-    mock_client_instance = MagicMock()
-    mock_client.return_value = mock_client_instance
-    mock_client_instance.search.return_value = []
+    cli_deps.client.return_value.search.return_value = []
 
     # Run the CLI
     result = runner.invoke(app, ["nonexistent_query"])
@@ -80,21 +63,18 @@ def test_cli_no_results(mock_client):
     assert "No papers found" in result.stdout
 
 
-@patch("pharma_papers.cli.PubMedClient")
-def test_cli_error_handling(mock_client):
-    """Test the CLI error handling."""
+@pytest.mark.parametrize("args,expected_exit", [
+    (["cancer"], 1),
+    (["cancer", "--debug"], 1),
+])
+def test_cli_error_handling(runner, cli_deps, args, expected_exit):
+    """Test the CLI error handling in normal and debug mode."""
     # Setup mocks to raise an exception
-    mock_client_instance = MagicMock()
-    mock_client.return_value = mock_client_instance
-    mock_client_instance.search.side_effect = Exception("API error")
+    cli_deps.client.return_value.search.side_effect = Exception("API error")
 
-    # Run the CLI in normal mode (not debug)
-    result = runner.invoke(app, ["cancer"])
+    # Run the CLI; debug mode re-raises the exception after reporting it
+    result = runner.invoke(app, args)
 
     # Verify the CLI exits with an error message
-    assert result.exit_code == 1
+    assert result.exit_code == expected_exit
     assert "Error: API error" in result.stdout
-
-    # Now run in debug mode which should raise the exception
-    result = runner.invoke(app, ["cancer", "--debug"])
-    assert result.exit_code == 1
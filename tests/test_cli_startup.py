@@ -0,0 +1,59 @@
+"""
+Tests that the CLI starts quickly by keeping heavy imports out of module scope.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Budget in microseconds for importing the package's own modules when showing --help
+_IMPORT_BUDGET_US = 150_000
+
+
+@pytest.fixture(scope="module")
+def help_run():
+    """Run the CLI's --help in a fresh interpreter with import timing enabled."""
+    env = dict(os.environ, PYTHONPROFILEIMPORTTIME="1")
+    return subprocess.run(
+        [sys.executable, "-m", "pharma_papers.cli", "--help"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+def _import_times(stderr: str) -> list:
+    """Parse -X importtime output into (module name, nesting depth, cumulative microseconds) tuples."""
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times.append((name.strip(), len(name) - len(name.lstrip()), int(cumulative)))
+    return times
+
+
+def test_cli_help_runs(help_run):
+    """Test that --help succeeds without running a query."""
+    assert help_run.returncode == 0
+    assert "No papers found" not in help_run.stdout
+    assert "QUERY" in help_run.stdout
+
+
+def test_cli_help_is_fast(help_run):
+    """Test that the package's own imports stay within the startup budget."""
+    times = _import_times(help_run.stderr)
+    top_level_depth = min(depth for _, depth, _ in times)
+    package_time = sum(
+        cumulative for name, depth, cumulative in times
+        if depth == top_level_depth and name.startswith("pharma_papers")
+    )
+    assert package_time < _IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize("module", ["Bio", "pandas", "requests", "concurrent.futures.process"])
+def test_cli_help_skips_heavy_imports(help_run, module):
+    """Test that --help does not import dependencies only needed to run a query."""
+    assert module not in {name for name, _, _ in _import_times(help_run.stderr)}
@@ -0,0 +1,27 @@
+"""
+Tests that heavy dependencies are only imported when they are needed.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _modules_loaded_by(statement: str) -> set:
+    """Run an import statement in a fresh interpreter and return the modules it loaded."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize("module", ["Bio.Entrez", "typer", "rich"])
+def test_cli_import_is_lazy(module):
+    """Test that importing the CLI module does not import heavy dependencies."""
+    assert module not in _modules_loaded_by("import pharma_papers.cli")
+
+
+def test_pubmed_client_import_is_lazy():
+    """Test that importing the PubMed client does not import Biopython."""
+    loaded = _modules_loaded_by("import pharma_papers.pubmed_client")
+    assert not any(name == "Bio" or name.startswith("Bio.") for name in loaded)
@@ -2,42 +2,25 @@
 Tests for the paper processor module.
 """
 
+import importlib.util
+import sys
+
 import pytest
 
+from pharma_papers import paper_processor as paper_processor_module
 from pharma_papers.paper_processor import PaperProcessor
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def paper_processor():
-    """Create a PaperProcessor instance for testing."""
+    """Create a PaperProcessor instance for testing (it holds no per-paper state, so tests can share it)."""
     return PaperProcessor(debug=True)
 
 
-def test_process_papers_with_pharma_affiliations(paper_processor):
+def test_process_papers_with_pharma_affiliations(paper_processor, pharma_paper_sample):
     """Test processing papers with pharmaceutical affiliations."""
-    # Sample paper with pharma affiliation
-    sample_papers = [
-        {
-            "pubmed_id": "12345",
-            "title": "Test Pharmaceutical Paper",
-            "publication_date": "2023/01/01",
-            "authors": [
-                {
-                    "name": "Smith, John",
-                    "affiliations": ["Pfizer Inc., New York, NY, USA"],
-                    "email": "john.smith@pfizer.com"
-                },
-                {
-                    "name": "Johnson, Emily",
-                    "affiliations": ["Harvard University, Boston, MA, USA"],
-                    "email": "emily.johnson@harvard.edu"
-                }
-            ]
-        }
-    ]
-
     # Process the papers
-    result = paper_processor.process_papers(sample_papers)
+    result = paper_processor.process_papers([pharma_paper_sample])
 
     # Verify the results
     assert len(result) == 1
@@ -48,71 +31,84 @@ def test_process_papers_with_pharma_affiliations(paper_processor):
     assert "john.smith@pfizer.com" in result[0]["corresponding_author_email"]
 
 
-def test_process_papers_without_pharma_affiliations(paper_processor):
+def test_process_papers_without_pharma_affiliations(paper_processor, academic_paper_sample):
     """Test processing papers without pharmaceutical affiliations."""
-    # Sample paper without pharma affiliation
-    sample_papers = [
+    # Process the papers
+    result = paper_processor.process_papers([academic_paper_sample])
+
+    # Verify no papers were found with pharma affiliations
+    assert len(result) == 0
+
+
+def test_indicator_tables_are_read_only(paper_processor):
+    """Test that the classification tables cannot be changed through a processor instance."""
+    assert "pfizer" in paper_processor.pharma_companies
+    with pytest.raises(AttributeError):
+        paper_processor.pharma_indicators = ()
+    with pytest.raises(AttributeError):
+        paper_processor.academic_indicators.append(r'\bcampus\b')
+
+
+def _alternating_papers(count):
+    """Build papers that alternate between an academic and a pharmaceutical author."""
+    affiliations = ["Harvard University, Boston, MA, USA", "Pfizer Inc., New York, NY, USA"]
+    return [
         {
-            "pubmed_id": "67890",
-            "title": "Test Academic Paper",
-            "publication_date": "2023/02/01",
+            "pubmed_id": str(i),
+            "title": f"Test Paper {i}",
+            "publication_date": "2023/01/01",
             "authors": [
                 {
-                    "name": "Brown, Robert",
-                    "affiliations": ["Stanford University, Stanford, CA, USA"],
-                    "email": "robert.brown@stanford.edu"
-                },
-                {
-                    "name": "Lee, Sarah",
-                    "affiliations": ["MIT, Cambridge, MA, USA"],
-                    "email": "sarah.lee@mit.edu"
+                    "name": "Smith, John",
+                    "affiliations": [affiliations[i % 2]],
+                    "email": None
                 }
             ]
         }
+        for i in range(count)
     ]
 
+
+def test_process_papers_serial_by_default(monkeypatch, paper_processor):
+    """Test that papers are processed without a process pool unless parallel processing is enabled."""
+    def fail_pool(*args, **kwargs):
+        raise AssertionError("process pool should not be started")
+
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", fail_pool)
+    monkeypatch.setattr("pharma_papers.paper_processor._PARALLEL_THRESHOLD", 64)
+    monkeypatch.setattr("pharma_papers.paper_processor._available_cpus", lambda: 4)
+
+    result = paper_processor.process_papers(_alternating_papers(100))
+    assert len(result) == 50
+
+
+def test_process_papers_in_parallel(monkeypatch):
+    """Test that large paper lists processed in a process pool give the same results in order."""
+    # Lower the threshold and report spare CPUs so the pool is used on any machine
+    monkeypatch.setattr("pharma_papers.paper_processor._PARALLEL_THRESHOLD", 64)
+    monkeypatch.setattr("pharma_papers.paper_processor._available_cpus", lambda: 2)
+
     # Process the papers
-    result = paper_processor.process_papers(sample_papers)
+    result = PaperProcessor(parallel=True).process_papers(_alternating_papers(100))
 
-    # Verify no papers were found with pharma affiliations
-    assert len(result) == 0
+    # Verify only the papers with pharma affiliations were kept, in their original order
+    assert [paper["pubmed_id"] for paper in result] == [str(i) for i in range(1, 100, 2)]
+    assert all(paper["company_affiliations"] == ["Pfizer"] for paper in result)
 
 
-def test_identify_pharma_authors_mixed_case(paper_processor):
+def test_identify_pharma_authors_mixed_case(paper_processor, mixed_affiliation_sample):
     """Test identifying pharmaceutical authors with mixed affiliations."""
-    # Sample paper with mixed academic and pharma affiliations
-    sample_paper = {
-        "pubmed_id": "24680",
-        "title": "Test Mixed Affiliation Paper",
-        "publication_date": "2023/03/01",
-        "authors": [
-            {
-                "name": "White, Thomas",
-                "affiliations": [
-                    "Department of Biology, Yale University, New Haven, CT, USA",
-                    "Moderna Therapeutics, Cambridge, MA, USA"
-                ],
-                "email": "thomas.white@moderna.com"
-            },
-            {
-                "name": "Garcia, Maria",
-                "affiliations": ["Novartis Institutes for BioMedical Research, Basel, Switzerland"],
-                "email": "maria.garcia@novartis.com"
-            },
-            {
-                "name": "Wilson, David",
-                "affiliations": ["Johns Hopkins University School of Medicine, Baltimore, MD, USA"],
-                "email": "david.wilson@jhu.edu"
-            }
-        ]
-    }
-
     # Identify pharma authors
     non_academic_authors, company_affiliations, corresponding_emails = paper_processor._identify_pharma_authors(
-        sample_paper)
+        mixed_affiliation_sample)
+    assert len(non_academic_authors) == 2
+
+    # Membership is all that matters below, so compare against sets
+    non_academic_authors = frozenset(non_academic_authors)
+    company_affiliations = frozenset(company_affiliations)
+    corresponding_emails = frozenset(corresponding_emails)
 
     # Verify the results
-    assert len(non_academic_authors) == 2
     assert "White, Thomas" in non_academic_authors
     assert "Garcia, Maria" in non_academic_authors
     assert "Wilson, David" not in non_academic_authors
@@ -122,22 +118,62 @@ def test_identify_pharma_authors_mixed_case(paper_processor):
     assert "maria.garcia@novartis.com" in corresponding_emails
 
 
-def test_extract_company_name(paper_processor):
+@pytest.mark.parametrize("affiliation,expected", [
+    # Direct company names
+    ("Pfizer Inc., New York, NY", "Pfizer"),
+    # Pattern matching
+    ("XYZ Pharmaceuticals, San Diego, CA", "XYZ Pharmaceuticals"),
+    # Unicode whitespace is normalized for both the known-company lookup and the patterns
+    ("Bluebird\xa0Bio, Cambridge, MA", "Bluebird Bio"),
+    ("Acme\xa0Pharmaceuticals, Boston", "Acme Pharmaceuticals"),
+    # No company
+    ("Department of Biology, University of California", None),
+])
+def test_extract_company_name(paper_processor, affiliation, expected):
     """Test extracting company names from affiliations."""
-    # Test with direct company names
-    assert "Pfizer" in paper_processor._extract_company_name("Pfizer Inc., New York, NY") or ""
-
-    # Test with pattern matching
-    company = paper_processor._extract_company_name("XYZ Pharmaceuticals, San Diego, CA")
-    assert company and "XYZ Pharmaceuticals" in company
+    company = paper_processor._extract_company_name(affiliation)
 
-    # Test with no company
-    assert paper_processor._extract_company_name("Department of Biology, University of California") is None
+    if expected is None:
+        assert company is None
+    else:
+        assert company and expected in company
 
 
-def test_extract_company_from_email(paper_processor):
+@pytest.mark.parametrize("domain,expected", [
+    ("pfizer.com", "Pfizer"),
+    ("research.novartis.com", "Novartis"),
+    ("biotech-company.io", "Biotech-Company"),
+    ("gmail.com", "Gmail"),  # Not ideal but expected behavior
+])
+def test_extract_company_from_email(paper_processor, domain, expected):
     """Test extracting company names from email domains."""
-    assert paper_processor._extract_company_from_email("pfizer.com") == "Pfizer"
-    assert paper_processor._extract_company_from_email("research.novartis.com") == "Novartis"
-    assert paper_processor._extract_company_from_email("biotech-company.io") == "Biotech-Company"
-    assert paper_processor._extract_company_from_email("gmail.com") == "Gmail"  # Not ideal but expected behavior
+    assert paper_processor._extract_company_from_email(domain) == expected
+
+
+def _load_paper_processor(monkeypatch, engine):
+    """Load a separate copy of the paper processor module that uses the given regex engine."""
+    if engine == "re2":
+        pytest.importorskip("re2")
+    else:
+        # A None entry makes `import re2` raise ImportError, selecting the standard library fallback
+        monkeypatch.setitem(sys.modules, "re2", None)
+
+    spec = importlib.util.spec_from_file_location(f"_paper_processor_{engine}", paper_processor_module.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module._re.__name__ == engine
+    return module
+
+
+@pytest.mark.parametrize("engine", ["re", "re2"])
+@pytest.mark.parametrize("affiliation,expected", [
+    ("Acme\xa0Pharmaceuticals, Boston", (True, ("Acme Pharmaceuticals",))),
+    ("Acme\u202fBiotech, Basel", (True, ("Acme Biotech",))),
+    ("Department\u2009of Chemistry, Harvard\xa0University", (False, ())),
+    ("Pfizer Inc., New York, NY", (True, ("Pfizer",))),
+    ("Universit\u00e9 de Montr\u00e9al, Canada", (False, ())),
+])
+def test_classify_affiliation_same_on_both_engines(monkeypatch, engine, affiliation, expected):
+    """Test that affiliations are classified the same way with the standard library and RE2 engines."""
+    module = _load_paper_processor(monkeypatch, engine)
+    assert module._classify_affiliation(affiliation) == expected
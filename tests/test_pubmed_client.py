@@ -2,11 +2,52 @@
 Tests for the PubMed client module.
 """
 
-from unittest.mock import patch, MagicMock
+import io
+import random
+import time
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import Mock
+from xml.etree import ElementTree
 
 import pytest
 
-from pharma_papers.pubmed_client import PubMedClient
+from pharma_papers.pubmed_client import PubMedClient, _RateLimiter
+
+# Sample EFetch response with a single PubMed record
+_SAMPLE_PUBMED_RECORD = b"""<?xml version="1.0" ?>
+<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle, 1st January 2024//EN"
+  "https://dtd.nlm.nih.gov/ncbi/pubmed/out/pubmed_240101.dtd">
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID Version="1">12345</PMID>
+      <Article>
+        <Journal>
+          <JournalIssue>
+            <PubDate>
+              <Year>2023</Year>
+            </PubDate>
+          </JournalIssue>
+        </Journal>
+        <ArticleTitle>Test Title</ArticleTitle>
+        <Abstract>
+          <AbstractText>This is a test abstract.</AbstractText>
+        </Abstract>
+        <AuthorList>
+          <Author>
+            <LastName>Smith</LastName>
+            <ForeName>John</ForeName>
+            <AffiliationInfo>
+              <Affiliation>Test University</Affiliation>
+            </AffiliationInfo>
+          </Author>
+        </AuthorList>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>
+"""
 
 
 @pytest.fixture
@@ -15,13 +56,15 @@ def pubmed_client():
     return PubMedClient(email="test@example.com", debug=True)
 
 
-@patch("pharma_papers.pubmed_client.Entrez")
-def test_search(mock_entrez, pubmed_client):
+def test_search(monkeypatch, pubmed_client):
     """Test the search method of the PubMed client."""
-    # Setup mock
-    mock_handle = MagicMock()
-    mock_entrez.esearch.return_value = mock_handle
-    mock_entrez.read.return_value = {"IdList": ["12345", "67890"]}
+    # Setup stubs
+    mock_handle = SimpleNamespace(close=Mock())
+    mock_entrez = SimpleNamespace(
+        esearch=Mock(return_value=mock_handle),
+        read=Mock(return_value={"IdList": ["12345", "67890"]})
+    )
+    monkeypatch.setattr("pharma_papers.pubmed_client.Entrez", mock_entrez)
 
     # Execute the search
     result = pubmed_client.search("test query", max_results=10)
@@ -41,47 +84,12 @@ def test_search(mock_entrez, pubmed_client):
     mock_handle.close.assert_called_once()
 
 
-@patch("pharma_papers.pubmed_client.Entrez")
-def test_fetch_details(mock_entrez, pubmed_client):
+def test_fetch_details(monkeypatch, pubmed_client):
     """Test the fetch_details method of the PubMed client."""
-    # Setup mock
-    mock_handle = MagicMock()
-    mock_entrez.efetch.return_value = mock_handle
-
-    # Sample PubMed record
-    sample_record = {
-        "PubmedArticle": [
-            {
-                "MedlineCitation": {
-                    "PMID": "12345",
-                    "Article": {
-                        "ArticleTitle": "Test Title",
-                        "Journal": {
-                            "JournalIssue": {
-                                "PubDate": {
-                                    "Year": "2023"
-                                }
-                            }
-                        },
-                        "AuthorList": [
-                            {
-                                "LastName": "Smith",
-                                "ForeName": "John",
-                                "AffiliationInfo": [
-                                    {"Affiliation": "Test University"}
-                                ]
-                            }
-                        ],
-                        "Abstract": {
-                            "AbstractText": ["This is a test abstract."]
-                        }
-                    }
-                }
-            }
-        ]
-    }
-
-    mock_entrez.read.return_value = sample_record
+    # Setup stubs
+    mock_response = SimpleNamespace(raw=io.BytesIO(_SAMPLE_PUBMED_RECORD), raise_for_status=Mock())
+    mock_session = SimpleNamespace(post=Mock(return_value=nullcontext(mock_response)))
+    monkeypatch.setattr(pubmed_client, "_session", mock_session)
 
     # Execute the fetch_details
     result = pubmed_client.fetch_details(["12345"])
@@ -93,29 +101,199 @@ def test_fetch_details(mock_entrez, pubmed_client):
     assert result[0]["publication_date"] == "2023"
     assert len(result[0]["authors"]) == 1
     assert result[0]["authors"][0]["name"] == "Smith John"
+    assert result[0]["authors"][0]["affiliations"] == ["Test University"]
+    assert result[0]["abstract"] == "This is a test abstract."
 
     # Verify the mocks were called correctly
-    mock_entrez.efetch.assert_called_once_with(
-        db="pubmed",
-        id="12345",
-        retmode="xml"
+    mock_session.post.assert_called_once_with(
+        "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi",
+        data={
+            "db": "pubmed",
+            "id": "12345",
+            "retmode": "xml",
+            "tool": "PharmaFilters",
+            "email": "test@example.com"
+        },
+        stream=True,
+        timeout=60
+    )
+    mock_response.raise_for_status.assert_called_once()
+    assert mock_response.raw.decode_content is True
+
+
+def test_fetch_details_deduplicates_and_caches(monkeypatch, pubmed_client):
+    """Test that fetch_details fetches each PubMed ID only once."""
+    # Setup stubs
+    mock_response = SimpleNamespace(
+        raw=io.BytesIO(
+            b"<PubmedArticleSet>"
+            b"<PubmedArticle><MedlineCitation><PMID>12345</PMID>"
+            b"<Article><ArticleTitle>Test Title</ArticleTitle></Article>"
+            b"</MedlineCitation></PubmedArticle>"
+            b"</PubmedArticleSet>"
+        ),
+        raise_for_status=Mock()
+    )
+    mock_session = SimpleNamespace(post=Mock(return_value=nullcontext(mock_response)))
+    monkeypatch.setattr(pubmed_client, "_session", mock_session)
+
+    # Duplicate IDs are fetched once
+    result = pubmed_client.fetch_details(["12345", "12345"])
+    assert [paper["pubmed_id"] for paper in result] == ["12345"]
+
+    # Already fetched IDs are served from the cache
+    result = pubmed_client.fetch_details(["12345"])
+    assert [paper["pubmed_id"] for paper in result] == ["12345"]
+    mock_session.post.assert_called_once()
+    assert mock_session.post.call_args.kwargs["data"]["id"] == "12345"
+
+
+def test_fetch_details_keeps_order_across_batches(monkeypatch, pubmed_client):
+    """Test that concurrently fetched batches are returned in the order of the requested IDs."""
+    delays = random.Random(0)
+
+    def post(url, data, stream, timeout):
+        # Answer each batch after a random delay so batches complete out of order
+        time.sleep(delays.uniform(0, 0.01))
+        articles = "".join(
+            f"<PubmedArticle><MedlineCitation><PMID>{pubmed_id}</PMID><Article/></MedlineCitation></PubmedArticle>"
+            for pubmed_id in data["id"].split(",")
+        )
+        body = f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode()
+        return nullcontext(SimpleNamespace(raw=io.BytesIO(body), raise_for_status=Mock()))
+
+    mock_session = SimpleNamespace(post=Mock(side_effect=post))
+    monkeypatch.setattr(pubmed_client, "_session", mock_session)
+    monkeypatch.setattr(pubmed_client, "_rate_limiter", SimpleNamespace(wait=lambda: None))
+
+    id_list = [str(pubmed_id) for pubmed_id in range(1000, 2002)]
+    result = pubmed_client.fetch_details(id_list, batch_size=50)
+
+    # Verify every batch was requested once and the papers kept their original order
+    assert mock_session.post.call_count == 21
+    assert [paper["pubmed_id"] for paper in result] == id_list
+
+
+def test_rate_limiter_spaces_requests(monkeypatch):
+    """Test that the rate limiter keeps consecutive requests at least one interval apart."""
+    clock = SimpleNamespace(now=100.0, sleeps=[])
+
+    def sleep(seconds):
+        clock.sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(
+        "pharma_papers.pubmed_client.time",
+        SimpleNamespace(monotonic=lambda: clock.now, sleep=sleep)
+    )
+    rate_limiter = _RateLimiter(requests_per_second=4)
+
+    # Back-to-back requests wait for their slot
+    request_times = []
+    for _ in range(3):
+        rate_limiter.wait()
+        request_times.append(clock.now)
+    assert request_times == [100.0, 100.25, 100.5]
+    assert clock.sleeps == [0.25, 0.25]
+
+    # After an idle period the next request goes out immediately
+    clock.now = 110.0
+    rate_limiter.wait()
+    assert clock.now == 110.0
+    assert clock.sleeps == [0.25, 0.25]
+
+
+@pytest.mark.parametrize("affiliations,expected", [
+    # Trailing sentence punctuation is not part of the address
+    (["Pfizer Inc., New York, NY, USA. Electronic address: john.smith@pfizer.com."], "john.smith@pfizer.com"),
+    (["Novartis, Basel, Switzerland (maria.garcia@novartis.com)"], "maria.garcia@novartis.com"),
+    # Only the first address found across the author's affiliations is kept
+    (
+        [
+            "Moderna, Cambridge, MA, USA. thomas.white@modernatx.com",
+            "Yale University, New Haven, CT, USA. thomas.white@yale.edu",
+        ],
+        "thomas.white@modernatx.com",
+    ),
+    (["Harvard University, Boston, MA, USA"], None),
+])
+def test_extract_paper_details_email(pubmed_client, affiliations, expected):
+    """Test that an author's email is taken from the first affiliation containing one."""
+    affiliation_info = "".join(
+        f"<AffiliationInfo><Affiliation>{affiliation}</Affiliation></AffiliationInfo>" for affiliation in affiliations
+    )
+    paper = ElementTree.fromstring(
+        "<PubmedArticle><MedlineCitation><PMID>12345</PMID><Article><AuthorList>"
+        f"<Author><LastName>Smith</LastName><ForeName>John</ForeName>{affiliation_info}</Author>"
+        "</AuthorList></Article></MedlineCitation></PubmedArticle>"
+    )
+
+    author = pubmed_client._extract_paper_details(paper)["authors"][0]
+    assert author["affiliations"] == affiliations
+    assert author["email"] == expected
+
+
+def test_extract_paper_details_missing_article(pubmed_client):
+    """Test that a record without an Article element yields the minimal error record."""
+    paper = ElementTree.fromstring(
+        "<PubmedArticle><MedlineCitation><PMID>12345</PMID></MedlineCitation></PubmedArticle>"
+    )
+
+    result = pubmed_client._extract_paper_details(paper)
+
+    assert result["pubmed_id"] == "12345"
+    assert result["title"] == "Error extracting paper details"
+    assert result["authors"] == []
+
+
+def test_fetch_summary(monkeypatch, pubmed_client):
+    """Test the fetch_summary method of the PubMed client."""
+    # Setup stubs
+    mock_handle = SimpleNamespace(close=Mock())
+    mock_entrez = SimpleNamespace(
+        esummary=Mock(return_value=mock_handle),
+        read=Mock(return_value=[
+            {
+                "Id": "12345",
+                "Title": "Test Title",
+                "PubDate": "2023 Jan 15",
+                "AuthorList": ["Smith J", "Doe A"]
+            }
+        ])
     )
+    monkeypatch.setattr("pharma_papers.pubmed_client.Entrez", mock_entrez)
+
+    # Execute the fetch_summary
+    result = pubmed_client.fetch_summary(["12345"])
+
+    # Verify the results
+    assert len(result) == 1
+    assert result[0]["pubmed_id"] == "12345"
+    assert result[0]["title"] == "Test Title"
+    assert result[0]["publication_date"] == "2023/Jan/15"
+    assert [author["name"] for author in result[0]["authors"]] == ["Smith J", "Doe A"]
+    assert result[0]["authors"][0]["affiliations"] == []
+
+    # Verify the mocks were called correctly
+    mock_entrez.esummary.assert_called_once_with(db="pubmed", id="12345")
     mock_entrez.read.assert_called_once_with(mock_handle)
     mock_handle.close.assert_called_once()
 
 
-@patch("pharma_papers.pubmed_client.Entrez")
-def test_search_error_handling(mock_entrez, pubmed_client):
+def test_search_error_handling(monkeypatch, pubmed_client):
     """Test error handling in the search method."""
-    # Setup mock to raise an exception on first call, then succeed on second
-    mock_entrez.esearch.side_effect = [
-        Exception("API error"),  # First call fails
-        MagicMock()  # Second call succeeds
-    ]
-
-    mock_handle = MagicMock()
-    mock_entrez.read.return_value = {"IdList": ["12345"]}
-    mock_entrez.esearch.return_value = mock_handle
+    # Skip the exponential backoff between retries
+    monkeypatch.setattr("pharma_papers.pubmed_client.time.sleep", lambda seconds: None)
+
+    # Setup stub to raise an exception on first call, then succeed on second
+    mock_entrez = SimpleNamespace(
+        esearch=Mock(side_effect=[
+            Exception("API error"),  # First call fails
+            SimpleNamespace(close=Mock())  # Second call succeeds
+        ]),
+        read=Mock(return_value={"IdList": ["12345"]})
+    )
+    monkeypatch.setattr("pharma_papers.pubmed_client.Entrez", mock_entrez)
 
     # Execute the search with retries
     result = pubmed_client.search("test query", retries=2)
@@ -0,0 +1,57 @@
+"""
+Tests for the utils module.
+"""
+
+import pytest
+
+from pharma_papers.utils import export_to_csv
+
+# CSV expected for the exported papers below; every field is quoted since all values are strings
+_EXPECTED_CSV = (
+    '"PubmedID","Title","Publication Date","Non-academic Author(s)","Company Affiliation(s)",'
+    '"Corresponding Author Email"\n'
+    '"12345","A ""Quoted"" Title","2023/01/01","Smith, John; Garcia, Maria","Pfizer; Novartis",'
+    '"john.smith@pfizer.com; maria.garcia@novartis.com"\n'
+    '"67890","Second Paper","2024","White, Thomas","","thomas.white@moderna.com"\n'
+)
+
+
+@pytest.fixture(scope="module")
+def exported_papers():
+    """Processed papers as returned by PaperProcessor.process_papers."""
+    return [
+        {
+            "pubmed_id": "12345",
+            "title": 'A "Quoted" Title',
+            "publication_date": "2023/01/01",
+            "non_academic_authors": ["Smith, John", "Garcia, Maria"],
+            "company_affiliations": ["Pfizer", "Novartis"],
+            "corresponding_author_email": "john.smith@pfizer.com; maria.garcia@novartis.com"
+        },
+        {
+            "pubmed_id": "67890",
+            "title": "Second Paper",
+            "publication_date": "2024",
+            "non_academic_authors": ["White, Thomas"],
+            "company_affiliations": [],
+            "corresponding_author_email": "thomas.white@moderna.com"
+        }
+    ]
+
+
+def test_export_to_csv_file(tmp_path, exported_papers):
+    """Test exporting papers to a CSV file in a directory that does not exist yet."""
+    filename = tmp_path / "results" / "papers.csv"
+
+    result = export_to_csv(exported_papers, str(filename))
+
+    assert result == str(filename)
+    assert filename.read_text(encoding="utf-8") == _EXPECTED_CSV
+
+
+def test_export_to_csv_stdout(capsys, exported_papers):
+    """Test printing papers as CSV to the console when no filename is given."""
+    result = export_to_csv(exported_papers)
+
+    assert result is None
+    assert capsys.readouterr().out == _EXPECTED_CSV